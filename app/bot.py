@@ -2,13 +2,22 @@ from __future__ import annotations
 
 import asyncio
 import datetime as dt
+import functools
 import importlib
-import importlib.util
-import pkgutil
+import os
 import sys
 from pathlib import Path
-from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, Literal, Union, cast, final, get_args, override
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    TypeIs,
+    Union,
+    cast,
+    final,
+    get_args,
+    override,
+)
 
 import discord as dc
 from discord.ext import commands
@@ -19,6 +28,8 @@ from app.status import BotStatus
 from app.utils import pretty_print_account, try_dm
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from githubkit import GitHub, TokenAuthStrategy
 
     from app.config import Config
@@ -34,30 +45,50 @@ EmojiName = Literal[
     "pull_merged",
     "pull_open",
 ]
+_VALID_EMOJI_NAMES = frozenset(get_args(EmojiName))
 
 # Emoji can be either a Discord Emoji object or a fallback string
 EmojiType = Union[dc.Emoji, str]
 
 
+_INTENTS = dc.Intents.default() | dc.Intents(members=True, message_content=True)
+_ALLOWED_MENTIONS = dc.AllowedMentions(everyone=False, roles=False)
+
+
+def _is_emoji_name(name: str) -> TypeIs[EmojiName]:
+    return name in _VALID_EMOJI_NAMES
+
+
+def _walk_modules(path: str | os.PathLike[str], prefix: str) -> Iterator[str]:
+    # Unlike pkgutil.walk_packages(), this doesn't need to import every package just to
+    # find its submodules.
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith("_"):
+                continue
+            if entry.is_dir():
+                if (Path(entry.path) / "__init__.py").is_file():
+                    yield f"{prefix}.{entry.name}"
+                    yield from _walk_modules(entry.path, f"{prefix}.{entry.name}")
+            elif entry.name.endswith(".py"):
+                yield f"{prefix}.{entry.name.removesuffix('.py')}"
+
+
 @final
 class GhosttyBot(commands.Bot):
     def __init__(self, config: Config, gh: GitHub[TokenAuthStrategy]) -> None:
-        intents = dc.Intents.default()
-        intents.members = True
-        intents.message_content = True
         super().__init__(
-            command_prefix=[],
-            intents=intents,
-            allowed_mentions=dc.AllowedMentions(everyone=False, roles=False),
+            command_prefix=[], intents=_INTENTS, allowed_mentions=_ALLOWED_MENTIONS
         )
 
         self.tree.on_error = interaction_error_handler
         self.config = config
         self.gh = gh
         self.bot_status = BotStatus()
+        # Set in on_ready(), compared against on every message.
+        self._user_id: int | None = None
 
-        self._ghostty_emojis: dict[EmojiName, EmojiType] = {}
-        self.ghostty_emojis = MappingProxyType(self._ghostty_emojis)
+        self.ghostty_emojis: dict[EmojiName, EmojiType] = {}
 
     @override
     async def on_error(self, event_method: str, /, *args: Any, **kwargs: Any) -> None:
@@ -69,53 +100,57 @@ class GhosttyBot(commands.Bot):
         logger.debug("loading extension {}", short_name)
         await super().load_extension(name, package=package)
 
-    async def _try_extension(
-        self,
+    @staticmethod
+    def _log_extension_failure(
         operation: Literal["load", "unload"],
         name: str,
-        *,
-        package: str | None = None,
-        user: Account | None = None,
-    ) -> bool:
-        extension_operation = (
-            self.load_extension if operation == "load" else self.unload_extension
-        )
-        try:
-            await extension_operation(name, package=package)
-        except commands.ExtensionFailed as error:
+        error: commands.ExtensionError,
+        user: Account | None,
+    ) -> None:
+        if isinstance(error, commands.ExtensionFailed):
             logger.opt(exception=error).exception(
                 (f"{pretty_print_account(user)} " if user else "")
                 + f"failed to {operation} `{name}`"
             )
-        except commands.ExtensionError as error:
-            message = (
-                f"{user} " if user else ""
-            ) + f"failed to {operation} `{name}`: {error}"
-            logger.warning(message)
-        else:
-            return True
-        return False
+            return
+        message = (
+            f"{user} " if user else ""
+        ) + f"failed to {operation} `{name}`: {error}"
+        logger.warning(message)
 
     async def try_load_extension(
         self, name: str, *, package: str | None = None, user: Account | None = None
     ) -> bool:
-        return await self._try_extension("load", name, package=package, user=user)
+        try:
+            await self.load_extension(name, package=package)
+        except commands.ExtensionError as error:
+            self._log_extension_failure("load", name, error, user)
+            return False
+        return True
 
     async def try_unload_extension(
         self, name: str, *, package: str | None = None, user: Account | None = None
     ) -> bool:
-        return await self._try_extension("unload", name, package=package, user=user)
+        try:
+            await self.unload_extension(name, package=package)
+        except commands.ExtensionError as error:
+            self._log_extension_failure("unload", name, error, user)
+            return False
+        return True
 
     @override
     async def setup_hook(self) -> None:
         # Load all component extensions
         extension_names = self.get_component_extension_names()
-        for extension in extension_names:
-            await self.try_load_extension(extension)
-        logger.info("loaded {} extensions", len(self.extensions))
+        # try_load_extension() already logs and swallows per-extension errors, so one
+        # failing component can't take the rest down with it.
+        results = await asyncio.gather(*map(self.try_load_extension, extension_names))
+        logger.info("loaded {}/{} extensions", sum(results), len(extension_names))
 
     async def on_ready(self) -> None:
         self.bot_status.last_login_time = dt.datetime.now(tz=dt.UTC)
+        if self.user is not None:
+            self._user_id = self.user.id
         await self.load_emojis()
         logger.info("logged in as {}", self.user)
 
@@ -125,13 +160,15 @@ class GhosttyBot(commands.Bot):
         if self.config.guild_id and (guild := self.get_guild(self.config.guild_id)):
             logger.trace("found ghostty guild")
             return guild
+        # Client.guilds builds a new list on every access, so only do that once.
+        guild = self.guilds[0]
         logger.info(
             "BOT_GUILD_ID unset or specified guild not found; using bot's first guild: "
             "{} (ID: {})",
-            self.guilds[0].name,
-            self.guilds[0].id,
+            guild.name,
+            guild.id,
         )
-        return self.guilds[0]
+        return guild
 
     @dc.utils.cached_property
     def log_channel(self) -> dc.TextChannel:
@@ -143,7 +180,7 @@ class GhosttyBot(commands.Bot):
     @override
     async def on_message(self, message: dc.Message, /) -> None:
         # Ignore our own messages
-        if message.author == self.user:
+        if message.author.id == self._user_id:
             return
 
         # Simple test
@@ -155,33 +192,34 @@ class GhosttyBot(commands.Bot):
         await self.process_commands(message)
 
     @classmethod
+    @functools.cache
     def get_component_extension_names(cls) -> frozenset[str]:
-        modules: set[str] = set()
-        for module_info in pkgutil.walk_packages(
-            [Path(__file__).parent / "components"], "app.components."
-        ):
-            if cls.is_valid_extension(module_info.name):
-                modules.add(module_info.name)
-
-        return frozenset(modules)
+        return frozenset(
+            name
+            for name in _walk_modules(
+                Path(__file__).parent / "components", "app.components"
+            )
+            if cls.is_valid_extension(name)
+        )
 
     @staticmethod
     def is_valid_extension(extension: str) -> bool:
-        return (
-            extension.startswith("app.components.")
-            and bool(importlib.util.find_spec(extension))
-            and callable(getattr(importlib.import_module(extension), "setup", None))
+        # No find_spec() check here: the names come from walking the directory, so they
+        # are known to exist. The module still has to be imported to look for `setup`,
+        # as handing helper modules to load_extension() would re-execute them.
+        return extension.startswith("app.components.") and callable(
+            getattr(importlib.import_module(extension), "setup", None)
         )
 
     async def load_emojis(self) -> None:
-        valid_emoji_names = frozenset(get_args(EmojiName))
-
-        for emoji in self.ghostty_guild.emojis:
-            if emoji.name in valid_emoji_names:
-                self._ghostty_emojis[cast("EmojiName", emoji.name)] = emoji
+        self.ghostty_emojis.update({
+            emoji.name: emoji
+            for emoji in self.ghostty_guild.emojis
+            if _is_emoji_name(emoji.name)
+        })
 
-        if missing_emojis := valid_emoji_names - self._ghostty_emojis.keys():
+        if missing_emojis := _VALID_EMOJI_NAMES.difference(self.ghostty_emojis):
             await self.log_channel.send(
                 "Failed to load the following emojis: " + ", ".join(missing_emojis)
             )
-            self._ghostty_emojis |= dict.fromkeys(missing_emojis, "❓")
+            self.ghostty_emojis |= dict.fromkeys(missing_emojis, "❓")
@@ -1,39 +1,77 @@
+import asyncio
 import datetime as dt
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import ClassVar
 
 from loguru import logger
 
 
 class TTRCache[KT, VT](ABC):
-    _ttr: dt.timedelta
+    _ttr: float
+    # Once more than this many keys are stored, the least recently used one is evicted.
+    maxsize: ClassVar[int] = 1024
 
     def __init__(self, **ttr: float) -> None:
         """Keyword arguments are passed to datetime.timedelta."""
-        self._ttr = dt.timedelta(**ttr)
-        self._cache: dict[KT, tuple[dt.datetime, VT]] = {}
+        # Entries are timestamped with time.monotonic(), which is all that's needed to
+        # tell how old they are and is much cheaper than building aware datetimes.
+        self._ttr = dt.timedelta(**ttr).total_seconds()
+        # Kept in least to most recently used order.
+        self._cache: OrderedDict[KT, tuple[float, VT]] = OrderedDict()
+        # Keys currently being fetched, resolved with the outcome of the fetch.
+        self._pending: dict[KT, asyncio.Future[None]] = {}
 
     def __contains__(self, key: KT) -> bool:
         return key in self._cache
 
-    def __getitem__(self, key: KT) -> tuple[dt.datetime, VT]:
+    def __getitem__(self, key: KT) -> tuple[float, VT]:
         return self._cache[key]
 
     def __setitem__(self, key: KT, value: VT) -> None:
-        self._cache[key] = (dt.datetime.now(tz=dt.UTC), value)
+        self._cache[key] = (time.monotonic(), value)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.maxsize:
+            evicted, _ = self._cache.popitem(last=False)
+            logger.trace("cache full; evicted {}", evicted)
 
     @abstractmethod
     async def fetch(self, key: KT) -> None:
         pass
 
     async def _refresh(self, key: KT) -> None:
-        if key not in self:
-            logger.debug("{} not in cache; fetching", key)
-            await self.fetch(key)
+        if (pending := self._pending.get(key)) is not None:
+            # Someone is already fetching this key (e.g. the same entity was mentioned
+            # in several messages at once), so wait for their result instead of sending
+            # a duplicate request.
+            logger.trace("{} is already being fetched; waiting", key)
+            # Shielded so that a cancelled waiter doesn't cancel everyone else's wait.
+            await asyncio.shield(pending)
             return
-        timestamp, *_ = self[key]
-        if dt.datetime.now(tz=dt.UTC) - timestamp >= self._ttr:
+        if (entry := self._cache.get(key)) is None:
+            logger.debug("{} not in cache; fetching", key)
+        elif time.monotonic() - entry[0] >= self._ttr:
             logger.debug("refreshing outdated key {}", key)
+        else:
+            return
+
+        self._pending[key] = done = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting, in which case the leader's own raise is what reports
+        # the failure; mark it as retrieved so asyncio doesn't log it a second time.
+        done.add_done_callback(lambda fut: fut.cancelled() or fut.exception())
+        try:
             await self.fetch(key)
+        except Exception as e:
+            done.set_exception(e)
+            raise
+        except BaseException:
+            done.cancel()
+            raise
+        else:
+            done.set_result(None)
+        finally:
+            del self._pending[key]
 
     async def get(self, key: KT) -> VT | None:
         await self._refresh(key)
@@ -41,4 +79,5 @@ class TTRCache[KT, VT](ABC):
             _, value = self[key]
         except KeyError:
             return None
+        self._cache.move_to_end(key)
         return value
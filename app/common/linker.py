@@ -2,31 +2,32 @@ from __future__ import annotations
 
 import asyncio
 import datetime as dt
-from dataclasses import dataclass, field
-from types import MappingProxyType
-from typing import TYPE_CHECKING, ClassVar, Self, final
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar, Self, final, override
 
 import discord as dc
 from loguru import logger
 
 from app.errors import SafeView
-from app.utils import is_dm, is_mod, pretty_print_account, safe_edit
+from app.utils import NO_MENTIONS, is_dm, is_mod, pretty_print_account, safe_edit
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Sequence
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ProcessedMessage:
     item_count: int
     content: str = ""
-    files: list[dc.File] = field(default_factory=list[dc.File])
-    embeds: list[dc.Embed] = field(default_factory=list[dc.Embed])
+    # Empty tuples are shared, so most outputs (which have no files or no embeds)
+    # don't allocate a list for each.
+    files: Sequence[dc.File] = ()
+    embeds: Sequence[dc.Embed] = ()
 
 
-async def remove_view_after_delay(message: dc.Message, delay: float = 30.0) -> None:
-    logger.trace("waiting {}s to remove view of {}", delay, message)
-    await asyncio.sleep(delay)
+async def remove_view(message: dc.Message) -> None:
     with safe_edit:
         logger.debug("removing view of {}", message)
         await message.edit(view=None)
@@ -34,13 +35,39 @@ async def remove_view_after_delay(message: dc.Message, delay: float = 30.0) -> N
 
 @final
 class MessageLinker:
+    __slots__ = (
+        "_frozen",
+        "_last_sweep",
+        "_refs",
+        "_removal_tasks",
+        "_reverse",
+        "_view_removals",
+    )
+    # Minimum number of seconds between two sweeps triggered by link().
+    sweep_interval: ClassVar[float] = 60.0
+
     def __init__(self) -> None:
-        self._refs: dict[dc.Message, dc.Message] = {}
-        self._frozen = set[dc.Message]()
+        # Everything is keyed by message ID: ints hash and compare much faster than
+        # dc.Message objects, and any version of a message (e.g. both sides of an edit)
+        # maps to the same key.
+        # Kept in the order the links were made, so that expired links can be popped
+        # off the front. (A plain dict would have to skip over the slots left behind
+        # by every deleted key to find its first item.)
+        self._refs: OrderedDict[int, tuple[dc.Message, dc.Message]] = OrderedDict()
+        # Mirrors _refs (reply -> original) so replies can be looked up without a scan.
+        self._reverse: dict[int, dc.Message] = {}
+        self._frozen = set[int]()
+        self._last_sweep = time.monotonic()
+        # Pending view removals, by reply ID; a new one replaces the old one. These are
+        # timer handles rather than sleeping tasks, so waiting costs next to nothing.
+        self._view_removals: dict[int, asyncio.TimerHandle] = {}
+        # The event loop only keeps weak references to tasks.
+        self._removal_tasks = set[asyncio.Task[None]]()
 
     @property
-    def refs(self) -> MappingProxyType[dc.Message, dc.Message]:
-        return MappingProxyType(self._refs)
+    def refs(self) -> tuple[dc.Message, ...]:
+        # A snapshot, so that callers can await while iterating over it.
+        return tuple(original for original, _ in self._refs.values())
 
     @property
     def expiry_threshold(self) -> dt.datetime:
@@ -48,46 +75,77 @@ class MessageLinker:
 
     def freeze(self, message: dc.Message) -> None:
         logger.debug("freezing message {}", message)
-        self._frozen.add(message)
+        self._frozen.add(message.id)
 
     def unfreeze(self, message: dc.Message) -> None:
         logger.debug("unfreezing message {}", message)
-        self._frozen.discard(message)
+        self._frozen.discard(message.id)
 
     def is_frozen(self, message: dc.Message) -> bool:
-        return message in self._frozen
+        return message.id in self._frozen
 
     def get(self, original: dc.Message) -> dc.Message | None:
-        return self._refs.get(original)
-
-    def free_dangling_links(self) -> None:
-        # Saving keys to a tuple to avoid a "changed size during iteration" error
-        for msg in tuple(self._refs):
-            if msg.created_at < self.expiry_threshold:
-                logger.trace("message {} is dangling; freeing", msg)
-                self.unlink(msg)
-                self.unfreeze(msg)
+        if (link := self._refs.get(original.id)) is not None:
+            return link[1]
+        return None
+
+    def free_dangling_links(self, *, full: bool = False) -> None:
+        self._last_sweep = time.monotonic()
+        threshold = self.expiry_threshold
+        if full:
+            for msg, _ in tuple(self._refs.values()):
+                if msg.created_at < threshold:
+                    logger.trace("message {} is dangling; freeing", msg)
+                    self.forget(msg)
+            return
+        while self._refs:
+            msg, _ = next(iter(self._refs.values()))
+            # Messages are almost always linked in the order they were sent, so the
+            # first one that hasn't expired yet means none of the ones after it have
+            # either. A message that was linked late (after an edit added its first
+            # mention) stays behind until every link ahead of it has expired, or until
+            # a full sweep.
+            if msg.created_at >= threshold:
+                break
+            logger.trace("message {} is dangling; freeing", msg)
+            self.forget(msg)
 
     def link(self, original: dc.Message, reply: dc.Message) -> None:
         logger.debug("linking {} to {}", original, reply)
-        self.free_dangling_links()
-        if original in self._refs:
+        if time.monotonic() - self._last_sweep >= self.sweep_interval:
+            self.free_dangling_links()
+        if original.id in self._refs:
             msg = f"message {original.id} already has a reply linked"
             raise ValueError(msg)
-        self._refs[original] = reply
+        self._refs[original.id] = (original, reply)
+        self._reverse[reply.id] = original
 
     def unlink(self, original: dc.Message) -> None:
         logger.debug("unlinking {}", original)
-        self._refs.pop(original, None)
+        if (link := self._refs.pop(original.id, None)) is not None:
+            self._reverse.pop(link[1].id, None)
 
     def get_original_message(self, reply: dc.Message) -> dc.Message | None:
-        return next(
-            (msg for msg, reply_ in self._refs.items() if reply == reply_), None
+        return self._reverse.get(reply.id)
+
+    def forget(self, original: dc.Message) -> None:
+        self.unlink(original)
+        self._frozen.discard(original.id)
+
+    def schedule_view_removal(self, reply: dc.Message, delay: float = 30.0) -> None:
+        if (pending := self._view_removals.pop(reply.id, None)) is not None:
+            logger.trace("rescheduling view removal of {}", reply)
+            pending.cancel()
+        logger.trace("waiting {}s to remove view of {}", delay, reply)
+        self._view_removals[reply.id] = asyncio.get_running_loop().call_later(
+            delay, self._start_view_removal, reply
         )
 
-    def unlink_from_reply(self, reply: dc.Message) -> None:
-        if (original_message := self.get_original_message(reply)) is not None:
-            self.unlink(original_message)
+    def _start_view_removal(self, reply: dc.Message) -> None:
+        self._view_removals.pop(reply.id, None)
+        task = asyncio.create_task(remove_view(reply))
+        self._removal_tasks.add(task)
+        task.add_done_callback(self._removal_tasks.discard)
 
     def is_expired(self, message: dc.Message) -> bool:
         return message.created_at < self.expiry_threshold
@@ -97,8 +155,7 @@ class MessageLinker:
             logger.debug(
                 "reply {} deleted; unlinking original message {}", message, original
             )
-            self.unlink(original)
-            self.unfreeze(original)
+            self.forget(original)
         elif (reply := self.get(message)) and not self.is_frozen(message):
             if self.is_expired(message):
                 logger.debug("message {} has expired; unlinking", message)
@@ -131,6 +188,12 @@ class MessageLinker:
             self.unlink(before)
             return
 
+        # Frozen messages are skipped whether or not they still have a reply, so there
+        # is no point in processing them first.
+        if self.is_frozen(before):
+            logger.trace("skipping frozen message {}", before)
+            return
+
         old_output = await message_processor(before)
         new_output = await message_processor(after)
         if old_output == new_output:
@@ -143,9 +206,6 @@ class MessageLinker:
         )
 
         if not (reply := self.get(before)):
-            if self.is_frozen(before):
-                logger.trace("skipping frozen message {}", before)
-                return
             if old_output.item_count > 0:
                 logger.trace(
                     "skipping message that was removed from the linker at some point "
@@ -156,10 +216,6 @@ class MessageLinker:
             await interactor(after)
             return
 
-        if self.is_frozen(before):
-            logger.trace("skipping frozen message {}", before)
-            return
-
         # Some processors use negative values to symbolize special error values, so this
         # can't be `== 0`. An example of this is the snippet_message() function in the
         # file app/components/github_integration/code_links.py
@@ -176,42 +232,59 @@ class MessageLinker:
             attachments=new_output.files,
             suppress=not new_output.embeds,
             view=view_type(after, new_output.item_count),
-            allowed_mentions=dc.AllowedMentions.none(),
+            allowed_mentions=NO_MENTIONS,
         )
-        await remove_view_after_delay(reply, view_timeout)
+        self.schedule_view_removal(reply, view_timeout)
 
 
 class ItemActions(SafeView):
     linker: ClassVar[MessageLinker]
     action_singular: ClassVar[str]
     action_plural: ClassVar[str]
+    # Rejection messages with a slot for the action, built once per subclass.
+    _rejection_singular: ClassVar[str]
+    _rejection_plural: ClassVar[str]
     message: dc.Message
     item_count: int
+    _rejection: str
 
     def __init__(self, message: dc.Message, item_count: int) -> None:
         super().__init__()
         self.message = message
         self.item_count = item_count
+        self._rejection = (
+            self._rejection_singular if item_count == 1 else self._rejection_plural
+        )
+
+    @override
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        if hasattr(cls, "action_singular"):
+            cls._rejection_singular = (
+                f"Only the person who {cls.action_singular} can {{}} this message."
+            )
+        if hasattr(cls, "action_plural"):
+            cls._rejection_plural = (
+                f"Only the person who {cls.action_plural} can {{}} this message."
+            )
 
     async def _reject_early(self, interaction: dc.Interaction, action: str) -> bool:
-        assert not is_dm(interaction.user)
-        if interaction.user.id == self.message.author.id or is_mod(interaction.user):
+        user = interaction.user
+        assert not is_dm(user)
+        if user.id == self.message.author.id or is_mod(user):
             logger.trace(
                 "{} run by {} who is the author or a mod",
                 action,
-                pretty_print_account(interaction.user),
+                pretty_print_account(user),
             )
             return False
         logger.debug(
             "{} run by {} who is not the author nor a mod",
             action,
-            pretty_print_account(interaction.user),
+            pretty_print_account(user),
         )
         await interaction.response.send_message(
-            "Only the person who "
-            + (self.action_singular if self.item_count == 1 else self.action_plural)
-            + f" can {action} this message.",
-            ephemeral=True,
+            self._rejection.format(action), ephemeral=True
         )
         return True
 
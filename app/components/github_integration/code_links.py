@@ -20,9 +20,8 @@ from app.common.linker import (
     ItemActions,
     MessageLinker,
     ProcessedMessage,
-    remove_view_after_delay,
 )
-from app.utils import suppress_embeds_after_delay
+from app.utils import NO_MENTIONS, suppress_embeds_after_delay
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -31,9 +30,11 @@ if TYPE_CHECKING:
 
     from app.bot import GhosttyBot
 
+# Possessive quantifiers (++) are used where backtracking can never lead to a match, so
+# that the engine gives up on near-misses right away.
 CODE_LINK_PATTERN = re.compile(
-    r"https?://(?:www\.)?github\.com/([a-zA-Z0-9\-]+)/([a-zA-Z0-9\-\._]+)/blob/"
-    r"([^/\s]+)/([^\?#\s]+)(?:[^\#\s]*)?#L(\d+)(?:C\d+)?(?:-L(\d+)(?:C\d+)?)?"
+    r"https?://(?:www\.)?github\.com/([a-zA-Z0-9\-]++)/([a-zA-Z0-9\-\._]++)/blob/"
+    r"([^/\s]++)/([^\?#\s]++)(?:[^\#\s]*)?#L(\d+)(?:C\d+)?(?:-L(\d+)(?:C\d+)?)?"
 )
 LANG_SUBSTITUTIONS = {
     "el": "lisp",
@@ -92,19 +93,25 @@ class CodeLinks(commands.Cog):
         self.cache = ContentCache(self.bot.gh, minutes=30)
 
     async def get_snippets(self, content: str) -> AsyncGenerator[Snippet]:
+        # Most messages have no links at all; don't bother running the regex on them.
+        if "github.com/" not in content:
+            return
+        links: list[tuple[SnippetPath, slice]] = []
         for match in CODE_LINK_PATTERN.finditer(content):
             *snippet_path, range_start, range_end = match.groups()
             snippet_path[-1] = snippet_path[-1].rstrip("/")
 
-            snippet_path = SnippetPath(*snippet_path)
             range_start = int(range_start)
             # slice(a - 1, b) since lines are 1-indexed
             content_range = slice(
                 range_start - 1,
                 int(range_end) if range_end else range_start,
             )
+            links.append((SnippetPath(*snippet_path), content_range))
 
-            if not (snippet := await self.cache.get(snippet_path)):
+        snippets = await asyncio.gather(*(self.cache.get(path) for path, _ in links))
+        for (snippet_path, content_range), snippet in zip(links, snippets, strict=True):
+            if not snippet:
                 continue
             selected_lines = "\n".join(snippet.splitlines()[content_range])
             lang = snippet_path.path.rpartition(".")[2]
@@ -188,13 +195,12 @@ class CodeLinks(commands.Cog):
             files=output.files,
             suppress_embeds=True,
             mention_author=False,
-            allowed_mentions=dc.AllowedMentions.none(),
+            allowed_mentions=NO_MENTIONS,
             view=CodeLinkActions(message, output.item_count),
         )
         self.linker.link(message, sent_message)
-        async with asyncio.TaskGroup() as group:
-            group.create_task(suppress_embeds_after_delay(message))
-            group.create_task(remove_view_after_delay(sent_message))
+        self.linker.schedule_view_removal(sent_message)
+        await suppress_embeds_after_delay(message)
 
     @commands.Cog.listener()
     async def on_message_delete(self, message: dc.Message) -> None:
@@ -35,8 +35,8 @@ if TYPE_CHECKING:
     from pydantic import BaseModel
 
 COMMENT_PATTERN = re.compile(
-    r"https?://(?:www\.)?github\.com/([a-zA-Z0-9\-]+)/([a-zA-Z0-9\-\._]+)/"
-    r"(issues|pull)/(\d+)/?#(\w+?-?)(\d+)"
+    r"https?://(?:www\.)?github\.com/([a-zA-Z0-9\-]++)/([a-zA-Z0-9\-\._]++)/"
+    r"(issues|pull)/(\d++)/?#(\w+?-?)(\d+)"
 )
 STATE_TO_COLOR = {
     "APPROVED": 0x2ECC71,  # green
@@ -202,10 +202,11 @@ async def _get_issue_comment(
 
 
 async def _get_pr_review(entity_gist: EntityGist, comment_id: int) -> Comment | None:
-    comment = (
-        await gh.rest.pulls.async_get_review(*entity_gist, comment_id)
-    ).parsed_data
-    entity = await entity_cache.get(entity_gist)
+    comment_resp, entity = await asyncio.gather(
+        gh.rest.pulls.async_get_review(*entity_gist, comment_id),
+        entity_cache.get(entity_gist),
+    )
+    comment = comment_resp.parsed_data
     return entity and Comment(
         author=_make_author(comment.user),
         body=comment.body,
@@ -225,10 +226,11 @@ async def _get_pr_review_comment(
     entity_gist: EntityGist, comment_id: int
 ) -> Comment | None:
     owner, repo, _ = entity_gist
-    comment = (
-        await gh.rest.pulls.async_get_review_comment(owner, repo, comment_id)
-    ).parsed_data
-    entity = await entity_cache.get(entity_gist)
+    comment_resp, entity = await asyncio.gather(
+        gh.rest.pulls.async_get_review_comment(owner, repo, comment_id),
+        entity_cache.get(entity_gist),
+    )
+    comment = comment_resp.parsed_data
     return entity and Comment(
         author=_make_author(comment.user),
         body=_prettify_suggestions(comment),
@@ -276,8 +278,11 @@ def _make_crlf_codeblock(lang: str, body: str) -> str:
 
 async def _get_event(entity_gist: EntityGist, comment_id: int) -> Comment | None:
     owner, repo, entity_no = entity_gist
-    event = (await gh.rest.issues.async_get_event(owner, repo, comment_id)).parsed_data
-    entity = await entity_cache.get(entity_gist)
+    event_resp, entity = await asyncio.gather(
+        gh.rest.issues.async_get_event(owner, repo, comment_id),
+        entity_cache.get(entity_gist),
+    )
+    event = event_resp.parsed_data
     if not entity:
         return None
     if event.event in ("review_requested", "review_request_removed"):
@@ -350,11 +355,15 @@ async def _get_entity_starter(entity_gist: EntityGist, _: int) -> Comment | None
 
 
 async def get_comments(content: str) -> AsyncGenerator[Comment]:
+    if "github.com/" not in content:
+        return
+    keys = dict.fromkeys(
+        (EntityGist(owner, repo, int(number)), event, int(event_no))
+        for owner, repo, _, number, event, event_no in COMMENT_PATTERN.findall(content)
+    )
+    comments = await asyncio.gather(*map(comment_cache.get, keys))
     found_comments = set[Comment]()
-    for match in COMMENT_PATTERN.finditer(content):
-        owner, repo, _, number, event, event_no = map(str, match.groups())
-        entity_gist = EntityGist(owner, repo, int(number))
-        comment = await comment_cache.get((entity_gist, event, int(event_no)))
+    for comment in comments:
         if comment and comment not in found_comments:
             found_comments.add(comment)
             yield comment
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING, final
 
 import discord as dc
@@ -11,7 +10,6 @@ from app.common.linker import (
     ItemActions,
     MessageLinker,
     ProcessedMessage,
-    remove_view_after_delay,
 )
 from app.components.github_integration.entities.fmt import get_entity_emoji
 from app.utils import suppress_embeds_after_delay
@@ -100,9 +98,8 @@ class GitHubComments(commands.Cog):
         )
         await message.edit(suppress=True)
         self.linker.link(message, sent_message)
-        async with asyncio.TaskGroup() as group:
-            group.create_task(suppress_embeds_after_delay(message))
-            group.create_task(remove_view_after_delay(sent_message))
+        self.linker.schedule_view_removal(sent_message)
+        await suppress_embeds_after_delay(message)
 
     async def process(self, msg: dc.Message) -> ProcessedMessage:
         comments = [self.comment_to_embed(i) async for i in get_comments(msg.content)]
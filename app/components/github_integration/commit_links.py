@@ -7,30 +7,35 @@ import string
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, cast, final
 
-import discord as dc
 from discord.ext import commands
 
 from app.common.linker import (
     ItemActions,
     MessageLinker,
     ProcessedMessage,
-    remove_view_after_delay,
 )
 from app.components.github_integration.commit_types import CommitCache, CommitKey
 from app.components.github_integration.entities.resolution import resolve_repo_signature
-from app.utils import dynamic_timestamp, format_diff_note, suppress_embeds_after_delay
+from app.utils import (
+    NO_MENTIONS,
+    dynamic_timestamp,
+    format_diff_note,
+    suppress_embeds_after_delay,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Iterable
 
+    import discord as dc
+
     from app.bot import GhosttyBot
     from app.components.github_integration.commit_types import CommitSummary
 
 COMMIT_SHA_PATTERN = re.compile(
     r"(?P<site>\bhttps?://(?:www\.)?github\.com/)?"
     r"\b(?:"
-        r"(?P<owner>\b[a-z0-9\-]+/)?"
-        r"(?P<repo>\b[a-z0-9\-\._]+)"
+        r"(?P<owner>\b[a-z0-9\-]++/)?"
+        r"(?P<repo>\b[a-z0-9\-\._]++)"
         r"(?P<sep>@|/commit/|/blob/)"
     r")?"
     r"(?P<sha>[a-f0-9]{7,40})\b",
@@ -65,7 +70,8 @@ class CommitLinks(commands.Cog):
 
     def _format(self, commit: CommitSummary) -> str:
         emoji = self.bot.ghostty_emojis["commit"]
-        title = commit.message.splitlines()[0]
+        # Only the first line is needed, so don't split the whole message.
+        title = commit.message.partition("\n")[0].removesuffix("\r")
         heading = f"{emoji} **Commit [`{commit.sha[:7]}`](<{commit.url}>):** {title}"
 
         if commit.committer and commit.committer.name == "web-flow":
@@ -120,6 +126,8 @@ class CommitLinks(commands.Cog):
     async def process(self, message: dc.Message) -> ProcessedMessage:
         shas = dict.fromkeys(COMMIT_SHA_PATTERN.findall(message.content))
         shas = [r async for r in self.resolve_repo_signatures(shas)]
+        if not shas:
+            return ProcessedMessage(item_count=0)
         commit_summaries = await asyncio.gather(*(self.cache.get(c) for c in shas))
         valid_shas = list(filter(None, commit_summaries))
         content = "\n\n".join(map(self._format, valid_shas))
@@ -137,13 +145,12 @@ class CommitLinks(commands.Cog):
             output.content,
             mention_author=False,
             suppress_embeds=True,
-            allowed_mentions=dc.AllowedMentions.none(),
+            allowed_mentions=NO_MENTIONS,
             view=CommitActions(message, output.item_count),
         )
         self.linker.link(message, reply)
-        async with asyncio.TaskGroup() as group:
-            group.create_task(suppress_embeds_after_delay(message))
-            group.create_task(remove_view_after_delay(reply))
+        self.linker.schedule_view_removal(reply)
+        await suppress_embeds_after_delay(message)
 
     @commands.Cog.listener()
     async def on_message_delete(self, message: dc.Message) -> None:
@@ -12,9 +12,9 @@ from discord.ext import commands, tasks
 from .cache import entity_cache
 from .fmt import entity_message, extract_entities
 from .resolution import ENTITY_REGEX
-from app.common.linker import ItemActions, MessageLinker, remove_view_after_delay
+from app.common.linker import ItemActions, MessageLinker
 from app.components.github_integration.models import Entity
-from app.utils import is_dm, safe_edit, suppress_embeds_after_delay
+from app.utils import NO_MENTIONS, is_dm, safe_edit, suppress_embeds_after_delay
 
 if TYPE_CHECKING:
     from app.bot import GhosttyBot
@@ -37,6 +37,9 @@ class GitHubEntities(commands.Cog):
         self.bot = bot
         self.linker = MessageLinker()
         EntityActions.linker = self.linker
+        # Caps how many refreshes and reply edits update_recent_mentions() has in
+        # flight, so that it doesn't trip GitHub's secondary rate limits.
+        self._update_limit = asyncio.Semaphore(5)
 
         self.update_recent_mentions.start()
 
@@ -46,7 +49,8 @@ class GitHubEntities(commands.Cog):
 
     @tasks.loop(hours=1)
     async def update_recent_mentions(self) -> None:
-        self.linker.free_dangling_links()
+        # A full sweep, so that no reply to an expired message is refreshed below.
+        self.linker.free_dangling_links(full=True)
         entity_to_message_map = defaultdict[Entity, list[dc.Message]](list)
 
         # Gather all currently actively mentioned entities
@@ -57,17 +61,25 @@ class GitHubEntities(commands.Cog):
                     entity_to_message_map[entity].append(msg)
 
         # Check which entities changed
-        for entity in tuple(entity_to_message_map):
-            key = (entity.owner, entity.repo_name, entity.number)
-            await entity_cache.fetch(key)
-            refreshed_entity = await entity_cache.get(key)
+        entities = tuple(entity_to_message_map)
+        refreshed_entities = await asyncio.gather(*map(self._refresh, entities))
+        for entity, refreshed_entity in zip(entities, refreshed_entities, strict=True):
             if entity == refreshed_entity:
                 entity_to_message_map.pop(entity)
 
         # Deduplicate remaining messages
         messages_to_update = set(chain.from_iterable(entity_to_message_map.values()))
 
-        for msg in messages_to_update:
+        await asyncio.gather(*map(self._update_reply, messages_to_update))
+
+    async def _refresh(self, entity: Entity) -> Entity | None:
+        key = (entity.owner, entity.repo_name, entity.number)
+        async with self._update_limit:
+            await entity_cache.fetch(key)
+            return await entity_cache.get(key)
+
+    async def _update_reply(self, msg: dc.Message) -> None:
+        async with self._update_limit:
             reply = self.linker.get(msg)
             assert reply is not None
 
@@ -76,7 +88,7 @@ class GitHubEntities(commands.Cog):
             with safe_edit:
                 await reply.edit(
                     content=new_output.content,
-                    allowed_mentions=dc.AllowedMentions.none(),
+                    allowed_mentions=NO_MENTIONS,
                 )
 
     @update_recent_mentions.before_loop
@@ -85,11 +97,9 @@ class GitHubEntities(commands.Cog):
 
     @commands.Cog.listener("on_message")
     async def reply_with_entities(self, message: dc.Message) -> None:
-        if (
-            message.author.bot
-            or message.type in IGNORED_MESSAGE_TYPES
-            or not ENTITY_REGEX.search(message.content)
-        ):
+        if message.author.bot or message.type in IGNORED_MESSAGE_TYPES:
+            return
+        if not (matches := list(ENTITY_REGEX.finditer(message.content))):
             return
 
         if is_dm(message.author):
@@ -103,20 +113,19 @@ class GitHubEntities(commands.Cog):
             output.content,
             suppress_embeds=True,
             mention_author=False,
-            allowed_mentions=dc.AllowedMentions.none(),
+            allowed_mentions=NO_MENTIONS,
             view=EntityActions(message, output.item_count),
         )
         self.linker.link(message, sent_message)
-
-        async with asyncio.TaskGroup() as group:
-            group.create_task(remove_view_after_delay(sent_message))
-            # The suppress is done here (instead of in resolve_repo_signatures) to
-            # prevent blocking I/O for 5 seconds. The regex is run again here because
-            # (1) modifying the signature of resolve_repo_signatures to accommodate that
-            # would make it ugly (2) we can't modify entity_message's signature as the
-            # hook system requires it to return a ProcessedMessage.
-            if any(m["site"] for m in ENTITY_REGEX.finditer(message.content)):
-                group.create_task(suppress_embeds_after_delay(message))
+        self.linker.schedule_view_removal(sent_message)
+
+        # The suppress is done here (instead of in resolve_repo_signatures) to
+        # prevent blocking I/O for 5 seconds. The matches from the check above are
+        # reused here because (1) modifying the signature of resolve_repo_signatures to
+        # accommodate that would make it ugly (2) we can't modify entity_message's
+        # signature as the hook system requires it to return a ProcessedMessage.
+        if any(m["site"] for m in matches):
+            await suppress_embeds_after_delay(message)
 
     @commands.Cog.listener()
     async def on_message_delete(self, message: dc.Message) -> None:
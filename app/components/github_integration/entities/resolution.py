@@ -20,8 +20,8 @@ if TYPE_CHECKING:
 
 ENTITY_REGEX = re.compile(
     r"(?P<site>\bhttps?://(?:www\.)?github\.com/)?"
-    r"(?P<owner>\b[a-z0-9\-]+/)?"
-    r"(?P<repo>\b[a-z0-9\-\._]+)?"
+    r"(?P<owner>\b[a-z0-9\-]++/)?"
+    r"(?P<repo>\b[a-z0-9\-\._]++)?"
     r"(?P<sep>/(?:issues|pull)/|#)"
     r"(?P<number>\d{1,6})(?!\.\d|/?#)\b",
     re.IGNORECASE,
@@ -81,6 +81,7 @@ async def resolve_entity_signatures(
     message: dc.Message,
 ) -> AsyncGenerator[EntitySignature]:
     valid_signatures = 0
+    suppressed = False
     for match in ENTITY_REGEX.finditer(remove_codeblocks(message.content)):
         site, sep = match["site"], match["sep"]
         # Ensure that the correct separator is used.
@@ -90,8 +91,10 @@ async def resolve_entity_signatures(
         # string if an incorrect separator was used, which would result in a ValueError
         # in the call to int().
         owner, repo, number = match["owner"], match["repo"], int(match["number"])
-        if site:
+        if site and not suppressed:
+            # One request is enough no matter how many links the message has.
             await message.edit(suppress=True)
+            suppressed = True
 
         if owner is None:
             if repo == "xkcd":
@@ -15,7 +15,6 @@ from app.common.linker import (
     ItemActions,
     MessageLinker,
     ProcessedMessage,
-    remove_view_after_delay,
 )
 
 if TYPE_CHECKING:
@@ -49,10 +48,13 @@ class XKCDFetchFailed(NamedTuple):
 
 
 class XKCDMentionCache(TTRCache[int, XKCDResult]):
+    def __init__(self, client: httpx.AsyncClient, **ttr: float) -> None:
+        super().__init__(**ttr)
+        self.client: httpx.AsyncClient = client
+
     @override
     async def fetch(self, key: int) -> None:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"https://xkcd.com/{key}/info.0.json")
+        resp = await self.client.get(f"https://xkcd.com/{key}/info.0.json")
         if resp.is_success:
             self[key] = XKCD(**resp.json())
         else:
@@ -80,7 +82,13 @@ class XKCDMentions(commands.Cog):
         self.bot = bot
         self.linker = MessageLinker()
         XKCDActions.linker = self.linker
-        self.cache = XKCDMentionCache(hours=12)
+        # Shared by every fetch so that connections to xkcd.com are reused.
+        self.http = httpx.AsyncClient()
+        self.cache = XKCDMentionCache(self.http, hours=12)
+
+    @override
+    async def cog_unload(self) -> None:
+        await self.http.aclose()
 
     @staticmethod
     def get_embed(xkcd: XKCDResult) -> dc.Embed:
@@ -105,6 +113,8 @@ class XKCDMentions(commands.Cog):
 
     async def process(self, message: dc.Message) -> ProcessedMessage:
         matches = dict.fromkeys(m[1] for m in XKCD_REGEX.finditer(message.content))
+        if not matches:
+            return ProcessedMessage(item_count=0)
         xkcds = await asyncio.gather(*(self.cache.get(int(m)) for m in matches))
         embeds = list(map(self.get_embed, xkcds))
         if len(embeds) > 10:
@@ -130,7 +140,7 @@ class XKCDMentions(commands.Cog):
         except dc.HTTPException:
             return
         self.linker.link(message, sent_message)
-        await remove_view_after_delay(sent_message)
+        self.linker.schedule_view_removal(sent_message)
 
     @commands.Cog.listener()
     async def on_message_delete(self, message: dc.Message) -> None:
@@ -15,6 +15,7 @@ from .message_data import MAX_ATTACHMENT_SIZE, ExtensibleMessage, MessageData, g
 
 __all__ = (
     "MAX_ATTACHMENT_SIZE",
+    "NO_MENTIONS",
     "Account",
     "ExtensibleMessage",
     "MessageData",
@@ -45,6 +46,8 @@ type Account = dc.User | dc.Member
 GuildTextChannel = dc.TextChannel | dc.Thread
 
 safe_edit = suppress(dc.NotFound, dc.HTTPException)
+# Shared instead of calling AllowedMentions.none() for every reply and edit.
+NO_MENTIONS = dc.AllowedMentions.none()
 
 
 def truncate(s: str, length: int, *, suffix: str = "…") -> str: